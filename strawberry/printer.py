@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-from itertools import chain
-from typing import TYPE_CHECKING, Dict, Optional, cast
+import dataclasses
+import sys
+from functools import lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Type, cast
+from weakref import WeakKeyDictionary
 
 from graphql.type import (
-    is_enum_type,
-    is_input_type,
-    is_object_type,
-    is_scalar_type,
+    GraphQLEnumType,
+    GraphQLInputObjectType,
+    GraphQLObjectType,
+    GraphQLScalarType,
     is_specified_directive,
 )
 from graphql.utilities.print_schema import (
@@ -28,77 +32,202 @@ from graphql.utilities.print_schema import (
 from strawberry.field import StrawberryField
 from strawberry.schema_directive import Location, StrawberrySchemaDirective
 from strawberry.types.types import TypeDefinition
+from strawberry.unset import UNSET
 
 
 if TYPE_CHECKING:
     from strawberry.schema import BaseSchema
 
 
+_FIELD_LOCATIONS = frozenset(
+    [Location.FIELD_DEFINITION, Location.INPUT_FIELD_DEFINITION]
+)
+_OBJECT_LOCATIONS = frozenset([Location.OBJECT])
+_INPUT_OBJECT_LOCATIONS = frozenset([Location.INPUT_OBJECT])
+
+_PRIMITIVE_TYPES = frozenset([str, int, float, bool])
+
+# directive names only depend on the directive definition and on the schema's
+# name converter, so we compute them once per schema instead of once per usage
+_directive_names: WeakKeyDictionary[
+    BaseSchema, Dict[Tuple[Type, Optional[str], str], str]
+] = WeakKeyDictionary()
+
+_printed_schemas: WeakKeyDictionary[BaseSchema, str] = WeakKeyDictionary()
+
+_directive_params_printers: WeakKeyDictionary[
+    Type, Callable[[Any], str]
+] = WeakKeyDictionary()
+
+
+def _get_directive_name(
+    directive: StrawberrySchemaDirective, schema: BaseSchema
+) -> str:
+    names = _directive_names.setdefault(schema, {})
+
+    # the same class can be wrapped by multiple directives with different
+    # names, so the key includes everything the name converter looks at
+    key = (directive.wrap, directive.graphql_name, directive.python_name)
+
+    name = names.get(key)
+
+    if name is None:
+        name = sys.intern(schema.config.name_converter.from_directive(directive))
+        names[key] = name
+
+    return name
+
+
+def _serialize_dataclass(value: Any) -> Any:
+    if dataclasses.is_dataclass(value):
+        serialized = {}
+
+        for field in dataclasses.fields(value):
+            # fields declared with init=False might have never been set
+            field_value = getattr(value, field.name, UNSET)
+
+            if field_value is UNSET:
+                continue
+
+            serialized[field.name] = _serialize_dataclass(field_value)
+
+        return serialized
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_serialize_dataclass(item) for item in value]
+
+    if isinstance(value, dict):
+        return {key: _serialize_dataclass(item) for key, item in value.items()}
+
+    return value
+
+
 def print_schema_directive_params(params: Dict) -> str:
-    if not params:
+    printed_params = []
+
+    for name, value in params.items():
+        if value is UNSET:
+            continue
+
+        printed_params.append(f'{name}: "{value}"')
+
+    if not printed_params:
         return ""
 
-    return "(" + ", ".join(f'{name}: "{value}"' for name, value in params.items()) + ")"
+    return "(" + ", ".join(printed_params) + ")"
+
+
+def _get_schema_directive_params_printer(
+    directive_class: Type,
+) -> Callable[[Any], str]:
+    printer = _directive_params_printers.get(directive_class)
+
+    if printer is None:
+        printer = _create_schema_directive_params_printer(directive_class)
+        _directive_params_printers[directive_class] = printer
+
+    return printer
+
+
+def _create_schema_directive_params_printer(
+    directive_class: Type,
+) -> Callable[[Any], str]:
+    # the arguments of a directive are fixed by its class, so we only need
+    # to inspect them once and can reuse the printer for every usage
+    field_names = [
+        sys.intern(field.name) for field in dataclasses.fields(directive_class)
+    ]
+
+    def print_params(instance: Any) -> str:
+        params = {}
+
+        for name in field_names:
+            # fields declared with init=False might have never been set
+            value = getattr(instance, name, UNSET)
+
+            # most directives only have primitive arguments, which don't
+            # need to go through the dataclass serializer
+            if type(value) not in _PRIMITIVE_TYPES:
+                value = _serialize_dataclass(value)
+
+            params[name] = value
+
+        return print_schema_directive_params(params)
+
+    return print_params
 
 
 def print_schema_directive(
     directive: StrawberrySchemaDirective, schema: BaseSchema
 ) -> str:
-    params = directive.instance.__dict__ if directive.instance else {}
+    params = (
+        _get_schema_directive_params_printer(directive.wrap)(directive.instance)
+        if directive.instance
+        else ""
+    )
 
-    directive_name = schema.config.name_converter.from_directive(directive)
+    directive_name = _get_directive_name(directive, schema)
 
-    return f" @{directive_name}{print_schema_directive_params(params)}"
+    return f" @{directive_name}{params}"
 
 
 def print_field_directives(field: Optional[StrawberryField], schema: BaseSchema) -> str:
-    if not field:
+    if not field or not field.directives:
         return ""
 
-    directives = (
-        directive
-        for directive in field.directives
-        if any(
-            location in [Location.FIELD_DEFINITION, Location.INPUT_FIELD_DEFINITION]
-            for location in directive.locations
-        )
-    )
-
     return "".join(
-        (print_schema_directive(directive, schema=schema) for directive in directives)
+        [
+            print_schema_directive(directive, schema=schema)
+            for directive in field.directives
+            if not _FIELD_LOCATIONS.isdisjoint(directive.location_set)
+        ]
     )
 
 
-def print_fields(type_, schema: BaseSchema) -> str:
-    strawberry_type = cast(TypeDefinition, schema.get_type_by_name(type_.name))
-
-    fields = []
+def _get_type_definition(type_, schema: BaseSchema) -> Optional[TypeDefinition]:
+    return cast(Optional[TypeDefinition], schema.get_type_by_name(type_.name))
 
-    for i, (name, field) in enumerate(type_.fields.items()):
-        python_name = field.extensions and field.extensions.get("python_name")
 
-        strawberry_field = (
-            strawberry_type.get_field(python_name)
-            if strawberry_type and python_name
-            else None
-        )
+def print_fields(
+    type_,
+    schema: BaseSchema,
+    *,
+    strawberry_type: Optional[TypeDefinition] = None,
+) -> str:
+    if strawberry_type is None:
+        strawberry_type = _get_type_definition(type_, schema)
 
-        args = print_args(field.args, "  ") if hasattr(field, "args") else ""
+    strawberry_fields = (
+        {field.python_name: field for field in strawberry_type.fields}
+        if strawberry_type
+        else {}
+    )
 
-        fields.append(
-            print_description(field, "  ", not i)
-            + f"  {name}"
-            + args
-            + f": {field.type}"
-            + print_field_directives(strawberry_field, schema=schema)
-            + print_deprecated(field.deprecation_reason)
+    fields = [
+        "".join(
+            [
+                print_description(field, "  ", not i),
+                f"  {name}",
+                print_args(field.args, "  "),
+                f": {field.type}",
+                print_field_directives(
+                    strawberry_fields.get(field.extensions.get("python_name")),
+                    schema=schema,
+                ),
+                print_deprecated(field.deprecation_reason),
+            ]
         )
+        for i, (name, field) in enumerate(type_.fields.items())
+    ]
 
     return print_block(fields)
 
 
-def print_extends(type_, schema: BaseSchema):
-    strawberry_type = cast(TypeDefinition, schema.get_type_by_name(type_.name))
+def print_extends(
+    type_, schema: BaseSchema, *, strawberry_type: Optional[TypeDefinition] = None
+) -> str:
+    if strawberry_type is None:
+        strawberry_type = _get_type_definition(type_, schema)
 
     if strawberry_type and strawberry_type.extend:
         return "extend "
@@ -106,69 +235,91 @@ def print_extends(type_, schema: BaseSchema):
     return ""
 
 
-def print_type_directives(type_, schema: BaseSchema) -> str:
-    strawberry_type = cast(TypeDefinition, schema.get_type_by_name(type_.name))
+def print_type_directives(
+    type_,
+    schema: BaseSchema,
+    *,
+    strawberry_type: Optional[TypeDefinition] = None,
+) -> str:
+    if strawberry_type is None:
+        strawberry_type = _get_type_definition(type_, schema)
 
-    if not strawberry_type:
+    if not strawberry_type or not strawberry_type.directives:
         return ""
 
     allowed_locations = (
-        [Location.INPUT_OBJECT] if strawberry_type.is_input else [Location.OBJECT]
-    )
-
-    directives = (
-        directive
-        for directive in strawberry_type.directives or []
-        if any(location in allowed_locations for location in directive.locations)
+        _INPUT_OBJECT_LOCATIONS if strawberry_type.is_input else _OBJECT_LOCATIONS
     )
 
     return "".join(
-        (print_schema_directive(directive, schema=schema) for directive in directives)
+        [
+            print_schema_directive(directive, schema=schema)
+            for directive in strawberry_type.directives
+            if not allowed_locations.isdisjoint(directive.location_set)
+        ]
     )
 
 
 def _print_object(type_, schema: BaseSchema) -> str:
-    return (
-        print_description(type_)
-        + print_extends(type_, schema)
-        + f"type {type_.name}"
-        + print_implemented_interfaces(type_)
-        + print_type_directives(type_, schema)
-        + print_fields(type_, schema)
+    strawberry_type = _get_type_definition(type_, schema)
+
+    return "".join(
+        [
+            print_description(type_),
+            print_extends(type_, schema, strawberry_type=strawberry_type),
+            f"type {type_.name}",
+            print_implemented_interfaces(type_),
+            print_type_directives(type_, schema, strawberry_type=strawberry_type),
+            print_fields(type_, schema, strawberry_type=strawberry_type),
+        ]
     )
 
 
 def _print_input_object(type_, schema: BaseSchema) -> str:
     fields = [
-        print_description(field, "  ", not i) + "  " + print_input_value(name, field)
+        "".join(
+            [
+                print_description(field, "  ", not i),
+                "  ",
+                print_input_value(name, field),
+            ]
+        )
         for i, (name, field) in enumerate(type_.fields.items())
     ]
-    return (
-        print_description(type_)
-        + f"input {type_.name}"
-        + print_type_directives(type_, schema)
-        + print_block(fields)
+    return "".join(
+        [
+            print_description(type_),
+            f"input {type_.name}",
+            print_type_directives(type_, schema),
+            print_block(fields),
+        ]
     )
 
 
-def _print_type(type_, schema: BaseSchema) -> str:
-    # prevents us from trying to print a scalar as an input type
-    if is_scalar_type(type_):
-        return print_scalar(type_)
+_TYPE_PRINTERS: Dict[Type, Callable[[Any, BaseSchema], str]] = {
+    GraphQLScalarType: lambda type_, schema: print_scalar(type_),
+    GraphQLEnumType: lambda type_, schema: print_enum(type_),
+    GraphQLObjectType: _print_object,
+    GraphQLInputObjectType: _print_input_object,
+}
 
-    if is_enum_type(type_):
-        return print_enum(type_)
 
-    if is_object_type(type_):
-        return _print_object(type_, schema)
+@lru_cache(maxsize=None)
+def _get_type_printer(type_class: Type) -> Callable[[Any, BaseSchema], str]:
+    # walk the mro so that subclasses (like our custom enum type) are
+    # printed the same way as the graphql-core type they extend
+    for base in type_class.__mro__:
+        if base in _TYPE_PRINTERS:
+            return _TYPE_PRINTERS[base]
 
-    if is_input_type(type_):
-        return _print_input_object(type_, schema)
+    return lambda type_, schema: original_print_type(type_)
 
-    return original_print_type(type_)
 
+def _print_type(type_, schema: BaseSchema) -> str:
+    return _get_type_printer(type(type_))(type_, schema)
 
-def print_schema(schema: BaseSchema) -> str:
+
+def _print_schema(schema: BaseSchema) -> str:
     graphql_core_schema = schema._schema  # type: ignore
 
     directives = filter(
@@ -176,12 +327,28 @@ def print_schema(schema: BaseSchema) -> str:
     )
     type_map = graphql_core_schema.type_map
 
-    types = filter(is_defined_type, map(type_map.get, sorted(type_map)))
+    defined_types = [item for item in type_map.items() if is_defined_type(item[1])]
+    defined_types.sort(key=itemgetter(0))
 
-    return "\n\n".join(
-        chain(
-            filter(None, [print_schema_definition(graphql_core_schema)]),
-            (print_directive(directive) for directive in directives),
-            (_print_type(type_, schema) for type_ in types),
-        )
-    )
+    printed = []
+
+    schema_definition = print_schema_definition(graphql_core_schema)
+
+    if schema_definition:
+        printed.append(schema_definition)
+
+    printed.extend(print_directive(directive) for directive in directives)
+    printed.extend(_print_type(type_, schema) for _, type_ in defined_types)
+
+    return "\n\n".join(printed)
+
+
+def print_schema(schema: BaseSchema) -> str:
+    # schemas can't be changed after they have been created, so we can safely
+    # reuse the printed SDL (used for example by the federation _service field)
+    sdl = _printed_schemas.get(schema)
+
+    if sdl is None:
+        sdl = _printed_schemas[schema] = _print_schema(schema)
+
+    return sdl
@@ -1,7 +1,7 @@
 import dataclasses
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional, Type
+from typing import FrozenSet, List, Optional, Type
 
 
 class Location(Enum):
@@ -26,6 +26,10 @@ class StrawberrySchemaDirective:
     locations: List[Location]
     description: Optional[str] = None
     instance: Optional[object] = dataclasses.field(init=False)
+    location_set: FrozenSet[Location] = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.location_set = frozenset(self.locations)
 
     def __call__(self, *args, **kwargs):
         # TODO: this should be implemented differently
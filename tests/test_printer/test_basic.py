@@ -189,3 +189,14 @@ def test_interface():
     schema = strawberry.Schema(query=Query)
 
     assert print_schema(schema) == textwrap.dedent(expected_type).strip()
+
+
+def test_print_schema_is_cached():
+    @strawberry.type
+    class Query:
+        hello: str
+
+    schema = strawberry.Schema(query=Query)
+
+    assert print_schema(schema) is print_schema(schema)
+    assert schema.as_str() == print_schema(schema)
@@ -1,8 +1,12 @@
+import dataclasses
 import textwrap
+from typing import FrozenSet, List, Optional, Tuple
 
 import strawberry
-from strawberry.printer import print_schema
+from strawberry.printer import print_schema, print_schema_directive_params
+from strawberry.schema.config import StrawberryConfig
 from strawberry.schema_directive import Location
+from strawberry.unset import UNSET
 
 
 def test_print_simple_directive():
@@ -85,3 +89,221 @@ def test_directive_on_types():
     schema = strawberry.Schema(query=Query)
 
     assert print_schema(schema) == textwrap.dedent(expected_type).strip()
+
+
+def test_directive_name_respects_schema_config():
+    @strawberry.schema_directive(locations=[Location.FIELD_DEFINITION])
+    class SensitiveField:
+        reason: str
+
+    @strawberry.type
+    class Query:
+        first_name: str = strawberry.field(directives=[SensitiveField(reason="GDPR")])
+
+    camel_case_schema = strawberry.Schema(query=Query)
+    snake_case_schema = strawberry.Schema(
+        query=Query, config=StrawberryConfig(auto_camel_case=False)
+    )
+
+    assert "@sensitiveField(" in print_schema(camel_case_schema)
+    assert "@SensitiveField(" in print_schema(snake_case_schema)
+
+
+def test_print_directive_skips_unset_values():
+    @strawberry.schema_directive(locations=[Location.FIELD_DEFINITION])
+    class Sensitive:
+        reason: str
+        details: Optional[str] = UNSET
+
+    @strawberry.type
+    class Query:
+        first_name: str = strawberry.field(directives=[Sensitive(reason="GDPR")])
+
+    expected_type = """
+    type Query {
+      firstName: String! @sensitive(reason: "GDPR")
+    }
+    """
+
+    schema = strawberry.Schema(query=Query)
+
+    assert print_schema(schema) == textwrap.dedent(expected_type).strip()
+
+
+def test_print_schema_directive_params_skips_unset_values():
+    assert print_schema_directive_params({"reason": "GDPR", "details": UNSET}) == (
+        '(reason: "GDPR")'
+    )
+    assert print_schema_directive_params({"details": UNSET}) == ""
+
+
+def test_print_directive_reused_with_different_values():
+    @strawberry.schema_directive(locations=[Location.FIELD_DEFINITION])
+    class Sensitive:
+        reason: str
+
+    @strawberry.type
+    class Query:
+        first_name: str = strawberry.field(directives=[Sensitive(reason="GDPR")])
+        last_name: str = strawberry.field(directives=[Sensitive(reason="GDPR")])
+        email: str = strawberry.field(directives=[Sensitive(reason="PII")])
+
+    expected_type = """
+    type Query {
+      firstName: String! @sensitive(reason: "GDPR")
+      lastName: String! @sensitive(reason: "GDPR")
+      email: String! @sensitive(reason: "PII")
+    }
+    """
+
+    schema = strawberry.Schema(query=Query)
+
+    assert print_schema(schema) == textwrap.dedent(expected_type).strip()
+
+
+def test_print_directive_with_string_collections():
+    @strawberry.schema_directive(locations=[Location.FIELD_DEFINITION])
+    class Sensitive:
+        reason: str
+        tags: List[str]
+        scopes: FrozenSet[str]
+
+    @strawberry.type
+    class Query:
+        first_name: str = strawberry.field(
+            directives=[
+                Sensitive(reason="GDPR", tags=["pii", "gdpr"], scopes=frozenset(["a"]))
+            ]
+        )
+
+    expected_type = """
+    type Query {
+      firstName: String! @sensitive(reason: "GDPR", tags: "['pii', 'gdpr']", scopes: "['a']")
+    }
+    """  # noqa: E501
+
+    schema = strawberry.Schema(query=Query)
+
+    assert print_schema(schema) == textwrap.dedent(expected_type).strip()
+
+
+def test_print_directive_with_unset_init_false_field():
+    @strawberry.schema_directive(locations=[Location.FIELD_DEFINITION])
+    class NoInit:
+        a: str
+        b: str = dataclasses.field(init=False)
+
+    @strawberry.type
+    class Query:
+        first_name: str = strawberry.field(directives=[NoInit(a="x")])
+
+    expected_type = """
+    type Query {
+      firstName: String! @noInit(a: "x")
+    }
+    """
+
+    schema = strawberry.Schema(query=Query)
+
+    assert print_schema(schema) == textwrap.dedent(expected_type).strip()
+
+
+def test_print_directive_with_nested_values():
+    @dataclasses.dataclass
+    class Tag:
+        name: str
+        extra: str = dataclasses.field(init=False)
+
+    @strawberry.schema_directive(locations=[Location.FIELD_DEFINITION])
+    class Tagged:
+        tag: Tag
+        names: Tuple[str, ...]
+
+    @strawberry.type
+    class Query:
+        first_name: str = strawberry.field(
+            directives=[Tagged(tag=Tag(name="x"), names=("x", "y"))]
+        )
+
+    expected_type = """
+    type Query {
+      firstName: String! @tagged(tag: "{'name': 'x'}", names: "['x', 'y']")
+    }
+    """
+
+    schema = strawberry.Schema(query=Query)
+
+    assert print_schema(schema) == textwrap.dedent(expected_type).strip()
+
+
+def test_print_directive_only_prints_dataclass_fields():
+    @strawberry.schema_directive(locations=[Location.FIELD_DEFINITION])
+    class WithPost:
+        a: str
+
+        def __post_init__(self):
+            self.extra = "x"
+
+    @strawberry.type
+    class Query:
+        first_name: str = strawberry.field(directives=[WithPost(a="q")])
+
+    expected_type = """
+    type Query {
+      firstName: String! @withPost(a: "q")
+    }
+    """
+
+    schema = strawberry.Schema(query=Query)
+
+    assert print_schema(schema) == textwrap.dedent(expected_type).strip()
+
+
+def test_print_directive_with_multiple_params():
+    @strawberry.schema_directive(locations=[Location.FIELD_DEFINITION])
+    class Sensitive:
+        reason: str
+        details: Optional[str] = UNSET
+        level: int = 1
+
+    @strawberry.type
+    class Query:
+        first_name: str = strawberry.field(directives=[Sensitive(reason="GDPR")])
+
+    expected_type = """
+    type Query {
+      firstName: String! @sensitive(reason: "GDPR", level: "1")
+    }
+    """
+
+    schema = strawberry.Schema(query=Query)
+
+    assert print_schema(schema) == textwrap.dedent(expected_type).strip()
+
+
+def test_print_directives_sharing_a_class():
+    class Base:
+        reason: str
+
+    Alpha = strawberry.schema_directive(
+        locations=[Location.FIELD_DEFINITION], name="alpha"
+    )(Base)
+    Beta = strawberry.schema_directive(
+        locations=[Location.FIELD_DEFINITION], name="beta"
+    )(Base)
+
+    @strawberry.type
+    class Query:
+        first_name: str = strawberry.field(directives=[Alpha(reason="GDPR")])
+        last_name: str = strawberry.field(directives=[Beta(reason="PII")])
+
+    expected_type = """
+    type Query {
+      firstName: String! @alpha(reason: "GDPR")
+      lastName: String! @beta(reason: "PII")
+    }
+    """
+
+    schema = strawberry.Schema(query=Query)
+
+    assert print_schema(schema) == textwrap.dedent(expected_type).strip()